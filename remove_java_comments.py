@@ -6,229 +6,338 @@ Handles edge cases like comments in strings, nested comments, etc.
 """
 
 import re
+import io
 import os
+import mmap
 import sys
 import argparse
+import collections
+import contextlib
+import errno
+import itertools
+import json
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
-class JavaCommentRemover:
-    def __init__(self):
-        # Track state while parsing
-        self.in_string = False
-        self.in_char = False
-        self.in_single_line_comment = False
-        self.in_multi_line_comment = False
-        self.string_delimiter = None
-        self.in_text_block = False  # Java 13+ text blocks
-        self.text_block_quotes = 0  # Count of quotes in text block delimiter
+# Comments and literals of Java source. Plain code between them is never
+# matched: searching for the next token skips it inside the regex engine.
+# Every alternative starts with a literal delimiter byte outside its group,
+# which lets the engine build a 256-entry table of possible first bytes and
+# skip plain code with one table lookup per byte.
+# Literals consume their escape sequences so that quotes and comment
+# markers inside them are never mistaken for token boundaries. Their bodies
+# are matched as runs of plain bytes between escapes, so the engine takes a
+# whole run per repeat rather than a single byte. Unterminated literals and
+# comments run to the end of the input. Comments and text blocks match
+# only their opening delimiter: their bodies can be long, a '//' may turn
+# out to be part of a URL, and remove_comments finds where they end with
+# find() instead. The source is scanned as raw bytes; every delimiter is
+# ASCII, so multi-byte UTF-8 sequences can never be mistaken for one.
+_TOKEN_RE = re.compile(rb'''
+    /(/)                                            # 1: single-line comment
+  | /(\*)                                           # 2: multi-line comment
+  | "(""(?=\s))                                     # 3: text block (Java 13+)
+  | "([^"\\]*(?:\\[\s\S][^"\\]*)*(?:"|\\?\Z))       # 4: string literal
+  | '([^'\\]*(?:\\[\s\S][^'\\]*)*(?:'|\\?\Z))       # 5: character literal
+''', re.VERBOSE)
+
+# Token kinds, as reported by match.lastindex for _TOKEN_RE. Kinds that need
+# more than the match come first, so one comparison separates string and
+# character literals, which are kept exactly as matched.
+_LINE_COMMENT, _BLOCK_COMMENT, _TEXT_BLOCK, _STRING, _CHAR = range(1, 6)
+
+# Files at least this large are memory-mapped rather than read into memory
+_MMAP_THRESHOLD = 1 << 20
+
+# Per-directory record of files already processed (see process_directory)
+_CACHE_FILE_NAME = '.java_comment_remover_cache.json'
+_CACHE_MAX_ENTRIES = 50000
+
+# Files queued per worker process ahead of the one whose result is reported
+_TASKS_PER_WORKER = 4
+
+# Protocol prefixes that mark a following '//' as part of a URL
+_URL_INDICATOR_RE = re.compile(rb'(?:https?|ftp|file):', re.IGNORECASE)
+
+
+def remove_comments(java_content):
+    """
+    Remove all comments from Java code while preserving functionality.
+    Handles all edge cases including text blocks, regex, URLs, etc.
+    
+    A single compiled regex searches for the next comment or literal, so
+    the per-character work happens inside the C regex engine and the
+    Python loop only runs once per comment or literal.
+    
+    Args:
+        java_content (bytes, mmap or str): The Java source code content
+    
+    Returns:
+        bytes or str: Java code with comments removed, as a new str if
+        java_content is a str. Bytes or mmap input without any comment
+        markers is returned as it is, not copied.
+    """
+    if isinstance(java_content, str):
+        return remove_comments(java_content.encode('utf-8')).decode('utf-8')
+    
+    # Without comment markers there is nothing to remove; a substring
+    # search is far cheaper than tokenizing every literal in the file
+    if java_content.find(b'//') == -1 and java_content.find(b'/*') == -1:
+        return java_content
+    
+    result = []
+    pos = 0
+    # Code and literals are not copied token by token: everything from
+    # last_emit up to the next dropped comment is emitted as one slice.
+    # Only non-empty pieces are appended, so the last ten pieces always
+    # cover the last ten bytes of output.
+    last_emit = 0
+    # Bound once: these run for every comment or literal in the file
+    search_token = _TOKEN_RE.search
+    search_url = _URL_INDICATOR_RE.search
+    emit = result.append
+    
+    while True:
+        match = search_token(java_content, pos)
+        if match is None:
+            break
+        kind = match.lastindex
         
-    def remove_comments(self, java_content):
-        """
-        Remove all comments from Java code while preserving functionality.
-        Handles all edge cases including text blocks, regex, URLs, etc.
+        if kind > _TEXT_BLOCK:
+            # Literals are kept as they are
+            pos = match.end()
+            continue
         
-        Args:
-            java_content (str): The Java source code content
-            
-        Returns:
-            str: Java code with comments removed
-        """
-        result = []
-        i = 0
-        length = len(java_content)
+        if kind == _TEXT_BLOCK:
+            pos = _text_block_end(java_content, match.end())
+            continue
         
-        while i < length:
-            char = java_content[i]
-            
-            # Handle escape sequences in strings, chars, and text blocks
-            if (self.in_string or self.in_char or self.in_text_block) and char == '\\':
-                if i + 1 < length:
-                    result.append(char)
-                    result.append(java_content[i + 1])
-                    i += 2
-                    continue
-                else:
-                    result.append(char)
-                    i += 1
-                    continue
-            
-            # Handle end of text blocks (Java 13+)
-            if self.in_text_block:
-                result.append(char)
-                if char == '"' and i + 2 < length and java_content[i + 1:i + 3] == '""':
-                    # Found closing """ for text block
-                    result.extend(['""'])
-                    self.in_text_block = False
-                    i += 3
-                    continue
-                i += 1
-                continue
-            
-            # Handle end of string literals
-            if self.in_string and char == self.string_delimiter:
-                self.in_string = False
-                self.string_delimiter = None
-                result.append(char)
-                i += 1
-                continue
-                
-            # Handle end of character literals
-            if self.in_char and char == "'":
-                self.in_char = False
-                result.append(char)
-                i += 1
-                continue
+        start = match.start()
+        if kind == _LINE_COMMENT:
+            # Double check this isn't part of a URL or protocol
+            # Look back to see if we might be in a URL context
+            if start - last_emit >= 10:
+                url_match = search_url(java_content, start - 10, start)
+            else:
+                preceding_context = (b''.join(result[-10:]) + java_content[last_emit:start])[-10:]
+                url_match = search_url(preceding_context)
             
-            # If we're in a string or char literal, just copy the character
-            if self.in_string or self.in_char:
-                result.append(char)
-                i += 1
-                continue
+            is_likely_url = url_match is not None
             
-            # Handle end of single-line comment
-            if self.in_single_line_comment and char == '\n':
-                self.in_single_line_comment = False
-                result.append(char)  # Keep the newline
-                i += 1
+            if is_likely_url:
+                # Keep the first slash and rescan from the second one
+                pos = start + 1
                 continue
             
-            # Handle end of multi-line comment
-            if self.in_multi_line_comment:
-                if char == '*' and i + 1 < length and java_content[i + 1] == '/':
-                    self.in_multi_line_comment = False
-                    i += 2  # Skip both * and /
-                    continue
+            # Drop the comment; the newline ending it is kept as code
+            if last_emit < start:
+                emit(java_content[last_emit:start])
+            end = java_content.find(b'\n', start)
+            if end == -1:
+                end = len(java_content)
+            carriage_return = java_content.find(b'\r', start, end)
+            if carriage_return != -1:
+                end = carriage_return
+            last_emit = end
+            pos = end
+        else:
+            if last_emit < start:
+                emit(java_content[last_emit:start])
+            end = java_content.find(b'*/', match.end())
+            end = len(java_content) if end == -1 else end + 2
+            # Preserve newlines to maintain line numbers for debugging,
+            # keeping the file's CRLF line endings if it uses them
+            if java_content.find(b'\n', start, end) != -1:
+                comment = java_content[start:end]
+                newlines = comment.count(b'\n')
+                if b'\r\n' in comment:
+                    emit(b'\r\n' * newlines)
                 else:
-                    # Skip characters inside multi-line comments
-                    # But preserve newlines to maintain line numbers for debugging
-                    if char == '\n':
-                        result.append(char)
-                    i += 1
-                    continue
-            
-            # Skip characters inside single-line comments (except newlines, handled above)
-            if self.in_single_line_comment:
-                i += 1
-                continue
-            
-            # Check for start of text blocks (Java 13+): """
-            if char == '"' and i + 2 < length and java_content[i:i + 3] == '"""':
-                # Check if this is actually a text block start (not just triple quotes in code)
-                # Text blocks must be followed by whitespace or newline
-                if i + 3 < length and (java_content[i + 3].isspace() or java_content[i + 3] == '\n'):
-                    self.in_text_block = True
-                    result.append('"""')
-                    i += 3
-                    continue
-            
-            # Check for start of comments (only when not in strings/chars/text blocks)
-            if char == '/':
-                if i + 1 < length:
-                    next_char = java_content[i + 1]
-                    
-                    # Start of single-line comment
-                    if next_char == '/':
-                        # Double check this isn't part of a URL or protocol
-                        # Look back to see if we might be in a URL context
-                        preceding_context = ''.join(result[-10:]).lower() if len(result) >= 10 else ''.join(result).lower()
-                        url_indicators = ['http:', 'https:', 'ftp:', 'file:']
-                        
-                        is_likely_url = any(indicator in preceding_context for indicator in url_indicators)
-                        
-                        if not is_likely_url:
-                            self.in_single_line_comment = True
-                            i += 2
-                            continue
-                    
-                    # Start of multi-line comment  
-                    elif next_char == '*':
-                        self.in_multi_line_comment = True
-                        i += 2
-                        continue
-            
-            # Check for start of string literals
-            if char in ['"']:
-                self.in_string = True
-                self.string_delimiter = char
-                result.append(char)
-                i += 1
-                continue
-            
-            # Check for start of character literals
-            if char == "'":
-                self.in_char = True
-                result.append(char)
-                i += 1
-                continue
-            
-            # Regular character - just copy it
-            result.append(char)
-            i += 1
-        
-        return ''.join(result)
+                    emit(b'\n' * newlines)
+            last_emit = end
+            pos = end
+    
+    result.append(java_content[last_emit:])
+    return b''.join(result)
+
+
+def _text_block_end(java_content, body_start):
+    """
+    Return the offset just past the text block whose body starts at
+    body_start, or the end of the input if the block is unterminated.
+    
+    Each candidate closing delimiter is found with find(); it is skipped if
+    its first quote is escaped, i.e. preceded by an odd run of backslashes.
+    """
+    pos = body_start
+    while True:
+        end = java_content.find(b'"""', pos)
+        if end == -1:
+            return len(java_content)
+        backslash = end
+        while backslash > body_start and java_content[backslash - 1] == 0x5C:
+            backslash -= 1
+        if (end - backslash) % 2 == 0:
+            return end + 3
+        pos = end + 1
+
+
+class JavaCommentRemover:
+    def remove_comments(self, java_content):
+        """
+        Remove all comments from Java code; see the module-level
+        remove_comments().
+        """
+        return remove_comments(java_content)
     
     def process_file(self, file_path, backup=True, in_place=False):
         """
         Process a single Java file to remove comments.
         
         Args:
-            file_path (str): Path to the Java file
+            file_path (Path or str): Path to the Java file
             backup (bool): Whether to create a backup file
             in_place (bool): Whether to modify the file in place
             
         Returns:
             tuple: (success: bool, message: str)
         """
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
+        
+        mapped = None
         try:
-            # Read the original file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-            
-            # Reset state for new file
-            self.in_string = False
-            self.in_char = False
-            self.in_single_line_comment = False
-            self.in_multi_line_comment = False
-            self.string_delimiter = None
-            self.in_text_block = False
-            self.text_block_quotes = 0
+            # Read the original file as raw bytes; no decoding is needed.
+            # Large files are memory-mapped so the input is never copied
+            # into a Python buffer.
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    original_content = mapped
+                else:
+                    original_content = f.read()
             
             # Remove comments
             cleaned_content = self.remove_comments(original_content)
             
+            backup_path = file_path.with_name(file_path.name + '.backup')
+            
+            if in_place and cleaned_content is not original_content:
+                st = os.stat(file_path)
+                if st.st_nlink > 1:
+                    # Replacing a hard-linked file would split it from its
+                    # other links, so it is rewritten through the link
+                    if backup:
+                        with open(backup_path, 'wb') as f:
+                            f.write(original_content)
+                        print(f"Backup created: {backup_path}")
+                    if mapped is not None:
+                        mapped.close()
+                    with open(file_path, 'wb') as f:
+                        f.write(cleaned_content)
+                    return True, f"Successfully processed: {file_path} -> {file_path}"
+                
+                # Write the cleaned content to a temporary file and swap it
+                # in with os.replace, so the file is never half-written.
+                # Symlinks are resolved so that the link itself is kept.
+                real_path = Path(os.path.realpath(file_path))
+                # Replacing only needs write access to the directory, so
+                # check the file itself as writing to it would
+                if not os.access(real_path, os.W_OK):
+                    raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(file_path))
+                is_link = file_path.is_symlink()
+                fd, temp_path = tempfile.mkstemp(
+                    dir=real_path.parent, prefix=f".{real_path.name}.", suffix='.tmp')
+                backed_up = False
+                try:
+                    with open(fd, 'wb') as f:
+                        f.write(cleaned_content)
+                    shutil.copymode(real_path, temp_path)
+                    if hasattr(os, 'chown'):
+                        try:
+                            os.chown(temp_path, st.st_uid, st.st_gid)
+                        except OSError:
+                            # Only an error if the file would change owner
+                            temp_st = os.stat(temp_path)
+                            if (temp_st.st_uid, temp_st.st_gid) != (st.st_uid, st.st_gid):
+                                raise
+                    
+                    # Create backup if requested: the original file itself
+                    # becomes the backup, so nothing is copied. A symlink's
+                    # backup is written as a copy next to the link.
+                    if backup and is_link:
+                        with open(backup_path, 'wb') as f:
+                            f.write(original_content)
+                        print(f"Backup created: {backup_path}")
+                    
+                    if mapped is not None:
+                        # Unmap before the mapped file is renamed
+                        mapped.close()
+                    
+                    if backup and not is_link:
+                        os.replace(real_path, backup_path)
+                        backed_up = True
+                        print(f"Backup created: {backup_path}")
+                    
+                    os.replace(temp_path, real_path)
+                except BaseException:
+                    # Put the original back and drop the partial output
+                    if backed_up:
+                        with contextlib.suppress(OSError):
+                            os.replace(backup_path, real_path)
+                    with contextlib.suppress(OSError):
+                        os.remove(temp_path)
+                    raise
+                
+                return True, f"Successfully processed: {file_path} -> {file_path}"
+            
             # Create backup if requested
             if backup:
-                backup_path = file_path + '.backup'
-                with open(backup_path, 'w', encoding='utf-8') as f:
+                with open(backup_path, 'wb') as f:
                     f.write(original_content)
                 print(f"Backup created: {backup_path}")
             
-            # Write the cleaned content
             if in_place:
-                output_path = file_path
-            else:
-                # Create output file with _no_comments suffix
-                path_obj = Path(file_path)
-                output_path = str(path_obj.parent / f"{path_obj.stem}_no_comments{path_obj.suffix}")
+                # No comments found; leave the file untouched
+                return True, f"Successfully processed: {file_path} -> {file_path}"
             
-            with open(output_path, 'w', encoding='utf-8') as f:
+            # Create output file with _no_comments suffix
+            output_path = _output_path(file_path)
+            with open(output_path, 'wb') as f:
                 f.write(cleaned_content)
             
             return True, f"Successfully processed: {file_path} -> {output_path}"
             
         except Exception as e:
             return False, f"Error processing {file_path}: {str(e)}"
+        
+        finally:
+            if mapped is not None:
+                mapped.close()
     
-    def process_directory(self, directory_path, backup=True, in_place=False, recursive=True):
+    def process_directory(self, directory_path, backup=True, in_place=False, recursive=True,
+                          max_workers=None, use_cache=False):
         """
         Process all Java files in a directory.
         
+        Files are independent, so they are spread over a pool of worker
+        processes; results are reported in the same order as a serial run.
+        
+        With use_cache, the modification time and size of every processed
+        file are recorded in a cache file at the top of the directory, and
+        later runs skip files whose recorded values still match.
+        
         Args:
             directory_path (str): Path to the directory
             backup (bool): Whether to create backup files
             in_place (bool): Whether to modify files in place
             recursive (bool): Whether to process subdirectories
+            max_workers (int): Number of worker processes (default: CPU count)
+            use_cache (bool): Whether to skip files unchanged since the last
+                cached run
         """
         directory = Path(directory_path)
         
@@ -236,35 +345,244 @@ class JavaCommentRemover:
             print(f"Error: Directory {directory_path} does not exist")
             return
         
-        # Find all Java files
-        if recursive:
-            java_files = list(directory.rglob("*.java"))
-        else:
-            java_files = list(directory.glob("*.java"))
+        # Find Java files lazily, so processing starts while the tree is
+        # still being walked
+        java_files = _iter_java_files(directory_path, recursive)
         
-        if not java_files:
+        # Peek at the first two files to tell an empty or single-file
+        # directory apart without walking the whole tree
+        first_files = list(itertools.islice(java_files, 2))
+        if not first_files:
             print(f"No Java files found in {directory_path}")
             return
         
-        print(f"Found {len(java_files)} Java file(s) to process")
-        
         success_count = 0
         error_count = 0
+        skipped_count = 0
         
-        for java_file in java_files:
-            success, message = self.process_file(str(java_file), backup, in_place)
-            print(message)
-            
-            if success:
-                success_count += 1
-            else:
-                error_count += 1
+        cache_path = os.path.join(directory_path, _CACHE_FILE_NAME)
+        cache = _load_cache(cache_path) if use_cache else None
+        
+        def changed_files():
+            nonlocal skipped_count
+            for java_file in itertools.chain(first_files, java_files):
+                if cache is not None:
+                    key = os.path.relpath(java_file, directory_path)
+                    # Popped so that a kept entry moves to the most
+                    # recently used end when it is put back
+                    entry = cache.pop(key, None)
+                    try:
+                        st = os.stat(java_file)
+                    except OSError:
+                        # Let process_file report the error
+                        yield java_file
+                        continue
+                    if (entry == [st.st_mtime_ns, st.st_size, in_place]
+                            and (in_place or _output_path(Path(java_file)).exists())):
+                        # Unchanged since it was last processed this way
+                        cache[key] = entry
+                        skipped_count += 1
+                        continue
+                yield java_file
+        
+        workers = max_workers or os.cpu_count() or 1
+        tasks = ((java_file, backup, in_place) for java_file in changed_files())
         
-        print(f"\nProcessing complete:")
+        if workers == 1 or len(first_files) == 1:
+            # Not worth starting worker processes
+            results = map(_process_one, tasks)
+            executor = None
+        else:
+            # Only a few files per worker are queued at a time, so the tree
+            # is walked as results come in rather than all up front
+            executor = ProcessPoolExecutor(max_workers=workers)
+            results = _map_in_order(executor, _process_one, tasks,
+                                    workers * _TASKS_PER_WORKER)
+        
+        try:
+            for java_file, success, message in results:
+                print(message)
+                
+                if success:
+                    success_count += 1
+                    if cache is not None:
+                        # Record the file as it is now; in place, that is
+                        # the cleaned version
+                        st = os.stat(java_file)
+                        key = os.path.relpath(java_file, directory_path)
+                        cache[key] = [st.st_mtime_ns, st.st_size, in_place]
+                else:
+                    error_count += 1
+        finally:
+            if executor is not None:
+                results.close()
+                executor.shutdown()
+            if cache is not None:
+                _save_cache(cache_path, cache)
+        
+        print(f"\nProcessing complete: {success_count + error_count + skipped_count} Java file(s) found")
         print(f"  Successfully processed: {success_count} files")
+        if cache is not None:
+            print(f"  Skipped (unchanged): {skipped_count} files")
         print(f"  Errors: {error_count} files")
 
 
+def _output_path(file_path):
+    """Return the path process_file writes to when not in place."""
+    return file_path.with_name(file_path.stem + '_no_comments' + file_path.suffix)
+
+
+def _load_cache(cache_path):
+    """
+    Load the processed-files cache written by _save_cache.
+    
+    Args:
+        cache_path (str): Path to the cache file
+        
+    Returns:
+        dict: Relative file path -> [mtime_ns, size, in_place]; empty if
+        the cache is missing or unreadable
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(cache_path, cache):
+    """
+    Write the processed-files cache, keeping only the most recently used
+    _CACHE_MAX_ENTRIES entries.
+    
+    Args:
+        cache_path (str): Path to the cache file
+        cache (dict): Cache as returned by _load_cache, least recently used
+            entries first
+    """
+    if len(cache) > _CACHE_MAX_ENTRIES:
+        cache = dict(itertools.islice(cache.items(), len(cache) - _CACHE_MAX_ENTRIES, None))
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Warning: could not write cache {cache_path}: {e}")
+
+
+def _iter_java_files(directory_path, recursive=True):
+    """
+    Yield the paths of the Java files in a directory tree.
+    
+    Walks the tree with os.scandir, whose entries already know whether they
+    are files or directories, so no extra stat call is made per entry.
+    Each directory is listed in full before its files are yielded, so
+    output files written while the walk is in progress are not picked up.
+    Symlinked directories are not followed and unreadable directories are
+    skipped.
+    
+    Args:
+        directory_path (str): Path to the directory
+        recursive (bool): Whether to descend into subdirectories
+        
+    Yields:
+        str: Path of each .java file
+    """
+    pending = [directory_path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        
+        subdirectories = []
+        for entry in entries:
+            if entry.name.endswith('.java') and entry.is_file():
+                yield entry.path
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+        
+        # Reversed so subdirectories are visited in listing order
+        pending.extend(reversed(subdirectories))
+
+
+# Shared instance used by worker processes; it holds no per-file state
+_REMOVER = JavaCommentRemover()
+
+
+def _process_one(task):
+    """
+    Run JavaCommentRemover.process_file in a worker process.
+    
+    Anything process_file prints is captured and prepended to the returned
+    message so the parent prints it in order instead of interleaving output
+    from several workers.
+    
+    Args:
+        task (tuple): (file_path: str, backup: bool, in_place: bool)
+        
+    Returns:
+        tuple: (file_path: str, success: bool, message: str)
+    """
+    file_path, backup, in_place = task
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        success, message = _REMOVER.process_file(file_path, backup, in_place)
+    return file_path, success, output.getvalue() + message
+
+
+def _map_in_order(executor, fn, iterable, window):
+    """
+    Like executor.map, but submit at most window calls ahead of the result
+    being yielded.
+    
+    executor.map submits every item before returning, which consumes the
+    whole iterable at once. Here it is consumed as results are taken.
+    
+    Args:
+        executor (Executor): Executor to run the calls in
+        fn (callable): Function to call on each item
+        iterable (iterable): Items to call fn on
+        window (int): Maximum number of calls submitted but not yet yielded
+        
+    Yields:
+        The result of fn for each item, in the order of iterable
+    """
+    pending = collections.deque()
+    try:
+        for item in iterable:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, item))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Closed early on an error or interrupt: drop the calls that have
+        # not started, so shutting the executor down does not wait for them
+        for future in pending:
+            future.cancel()
+
+
+def _positive_int(value):
+    """
+    Parse a command line value that must be a positive integer.
+    
+    Args:
+        value (str): Value given on the command line
+        
+    Returns:
+        int: The parsed value
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Remove comments from Java files while preserving functionality"
@@ -288,6 +606,17 @@ def main():
         action="store_true", 
         help="Don't process subdirectories recursively"
     )
+    parser.add_argument(
+        "-j", "--jobs", 
+        type=_positive_int, 
+        default=None, 
+        help="Number of worker processes for directories (default: CPU count)"
+    )
+    parser.add_argument(
+        "--cache", 
+        action="store_true", 
+        help="Skip directory files unchanged since the last --cache run"
+    )
     
     args = parser.parse_args()
     
@@ -307,12 +636,12 @@ def main():
             print("Error: File must have .java extension")
             sys.exit(1)
         
-        success, message = remover.process_file(str(path), backup, in_place)
+        success, message = remover.process_file(path, backup, in_place)
         print(message)
         sys.exit(0 if success else 1)
     
     elif path.is_dir():
-        remover.process_directory(str(path), backup, in_place, recursive)
+        remover.process_directory(str(path), backup, in_place, recursive, args.jobs, args.cache)
     
     else:
         print(f"Error: {args.path} is neither a file nor a directory")
@@ -340,6 +669,9 @@ python remove_java_comments.py --no-backup src/
 # Process directory in place without recursion
 python remove_java_comments.py --in-place --no-recursive src/
 
+# Process directory with 4 worker processes
+python remove_java_comments.py --jobs 4 src/
+
 # Process current directory
 python remove_java_comments.py .
 